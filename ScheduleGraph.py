@@ -1,6 +1,17 @@
 from utils import bold, dark_gray, print_matrix, vertex_name
 from utils import remove_line, remove_col, get_predecessors, has_negative_edge, get_successors
+from array import array
 import copy
+import struct
+import sys
+
+# Calendars are stored as contiguous arrays of signed 64-bit integers, which expose the buffer protocol.
+# They can therefore be wrapped without copying, e.g. with `memoryview(graph.earliest_dates)` or `numpy.frombuffer(graph.earliest_dates, dtype=numpy.int64)`.
+CALENDAR_TYPECODE = 'q'
+# Header of the binary calendar dump: magic bytes, format version and number of vertices (little-endian).
+CALENDAR_DUMP_HEADER = struct.Struct('<4sII')
+CALENDAR_DUMP_MAGIC = b'SGCL'
+CALENDAR_DUMP_VERSION = 1
 
 class ScheduleGraph:
     def __init__(self, path: str):
@@ -10,14 +21,24 @@ class ScheduleGraph:
             path: The file path to the schedule data.
         """
 
-        """Earliest date of each task"""
-        self.earliest_dates = []
-        """Latest date of each task"""
-        self.latest_dates = []
-        """Total float of each task"""
-        self.total_floats = []
-        """Free float of each task"""
-        self.free_floats = []
+        """Vertices of the graph ordered by rank"""
+        self.rank_order = array(CALENDAR_TYPECODE)
+        """Earliest date of each task, ordered by rank"""
+        self.earliest_dates = array(CALENDAR_TYPECODE)
+        """Latest date of each task, ordered by rank"""
+        self.latest_dates = array(CALENDAR_TYPECODE)
+        """Total float of each task, ordered by rank"""
+        self.total_floats = array(CALENDAR_TYPECODE)
+        """Free float of each task, ordered by rank"""
+        self.free_floats = array(CALENDAR_TYPECODE)
+        """Earliest date of each task, indexed by task ID"""
+        self.task_earliest_dates = array(CALENDAR_TYPECODE)
+        """Latest date of each task, indexed by task ID"""
+        self.task_latest_dates = array(CALENDAR_TYPECODE)
+        """Total float of each task, indexed by task ID"""
+        self.task_total_floats = array(CALENDAR_TYPECODE)
+        """Free float of each task, indexed by task ID"""
+        self.task_free_floats = array(CALENDAR_TYPECODE)
         """Critical paths of the graph"""
         self.critical_paths = []
         """Length of critical paths"""
@@ -207,7 +228,7 @@ class ScheduleGraph:
                 potential_early_date = earliest_dates[pred_index]+durations[pred_index]
                 if potential_early_date > earliest_dates[i]:
                     earliest_dates[i] = potential_early_date
-        self.earliest_dates = earliest_dates
+        self.earliest_dates = array(CALENDAR_TYPECODE, earliest_dates)
 
         # Computing the latest dates
         latest_dates = [earliest_dates[len(earliest_dates)-1] for i in range(len(ranked_vertices))] # Create an initial list for the latest dates
@@ -218,18 +239,30 @@ class ScheduleGraph:
                 potential_late_date = latest_dates[succ_index]-durations[i]
                 if potential_late_date < latest_dates[i]:
                     latest_dates[i] = potential_late_date
-        self.latest_dates = latest_dates
+        self.latest_dates = array(CALENDAR_TYPECODE, latest_dates)
 
         # Computing total float
-        self.total_floats = [latest_dates[i]-earliest_dates[i] for i in range(len(ranked_vertices))]
+        self.total_floats = array(CALENDAR_TYPECODE, [latest_dates[i]-earliest_dates[i] for i in range(len(ranked_vertices))])
 
         # Computing free float
         free_float =[]
         for i in range(len(ranked_vertices)-1):
             succ_earliest_date = min([earliest_dates[ranked_vertices.index(vertex)] for vertex in successors[i]])
             free_float.append(succ_earliest_date-earliest_dates[i]-durations[i])
-        self.free_floats = free_float + [0]
-        
+        self.free_floats = array(CALENDAR_TYPECODE, free_float + [0])
+
+        # Storing the calendars indexed by task ID as well
+        self.rank_order = array(CALENDAR_TYPECODE, ranked_vertices)
+        self.task_earliest_dates = array(CALENDAR_TYPECODE, [0]) * len(ranked_vertices)
+        self.task_latest_dates = array(CALENDAR_TYPECODE, [0]) * len(ranked_vertices)
+        self.task_total_floats = array(CALENDAR_TYPECODE, [0]) * len(ranked_vertices)
+        self.task_free_floats = array(CALENDAR_TYPECODE, [0]) * len(ranked_vertices)
+        for i, vertex in enumerate(ranked_vertices):
+            self.task_earliest_dates[vertex] = self.earliest_dates[i]
+            self.task_latest_dates[vertex] = self.latest_dates[i]
+            self.task_total_floats[vertex] = self.total_floats[i]
+            self.task_free_floats[vertex] = self.free_floats[i]
+
         # Computing critical paths
         critical_tasks = []
         for i in range(len(ranked_vertices)):
@@ -267,3 +300,49 @@ class ScheduleGraph:
 
         self.critical_paths = longest_critical_paths
         self.critical_paths_length = max_critical_path_length
+
+
+    def dump_calendars(self, path: str) -> None:
+        """
+        Writes the computed calendars to a binary file, so that they can be handed to other processes.
+        The file contains a header (magic bytes, format version, number of vertices), followed by
+        the rank order and the earliest dates, latest dates, total floats and free floats indexed by task ID,
+        each stored as little-endian signed 64-bit integers.
+        Args:
+            path: The file path to write the calendars to.
+        """
+        arrays = [self.rank_order, self.task_earliest_dates, self.task_latest_dates, self.task_total_floats, self.task_free_floats]
+        file = open(path, 'wb')
+        file.write(CALENDAR_DUMP_HEADER.pack(CALENDAR_DUMP_MAGIC, CALENDAR_DUMP_VERSION, len(self.rank_order)))
+        for values in arrays:
+            if sys.byteorder == 'big': # The dump is always little-endian, whatever the platform
+                values = array(CALENDAR_TYPECODE, values)
+                values.byteswap()
+            file.write(memoryview(values).cast('B'))
+        file.close()
+
+
+    @staticmethod
+    def load_calendars(path: str) -> dict[str, array]:
+        """
+        Reads calendars written by `dump_calendars`.
+        Args:
+            path: The file path to read the calendars from.
+        Returns:
+            A dictionary mapping `rank_order`, `earliest_dates`, `latest_dates`, `total_floats` and `free_floats`
+            to their arrays, the last four being indexed by task ID.
+        """
+        file = open(path, 'rb')
+        magic, version, N = CALENDAR_DUMP_HEADER.unpack(file.read(CALENDAR_DUMP_HEADER.size))
+        if magic != CALENDAR_DUMP_MAGIC or version != CALENDAR_DUMP_VERSION:
+            file.close()
+            raise ValueError(f'{path} is not a calendar dump.')
+        calendars = {}
+        for name in ['rank_order', 'earliest_dates', 'latest_dates', 'total_floats', 'free_floats']:
+            values = array(CALENDAR_TYPECODE)
+            values.fromfile(file, N)
+            if sys.byteorder == 'big':
+                values.byteswap()
+            calendars[name] = values
+        file.close()
+        return calendars
@@ -145,8 +145,8 @@ while running:
 				latest_dates[1],
 				earliest_dates[-1],
 				latest_dates[-1],
-				['Free float'] + graph.free_floats,
-				['Total float'] + graph.total_floats,
+				['Free float'] + graph.free_floats.tolist(),
+				['Total float'] + graph.total_floats.tolist(),
 			]
 			print_matrix([['Total & Free floats calendar']])
 			print_matrix(floats, header_row=False, transformer=lambda f,v,y,x: dark_gray(f) if y != 0 and v == 0 else f)